@@ -18,12 +18,48 @@ Better promoters have the right spacing between the two parts (16-19 letters apa
 """
 
 import sys  # This helps us stop the program if something goes wrong
+from bisect import bisect_right  # Fast searching in sorted lists
+from itertools import islice  # Loops over part of a list without copying it
+from operator import itemgetter  # Fast way to pick one item out of a tuple when sorting
 
 # These numbers define what we consider "good spacing" between promoter parts
 GAP_MIN = 16     # Minimum good distance
 GAP_AVERAGE = 17 # Perfect distance  
 GAP_MAX = 19     # Maximum good distance
 
+# Wider ranges of spacing that still give a working (but weaker) promoter
+GAP_GOOD_MIN = 14    # Good spacing starts here
+GAP_GOOD_MAX = 21    # Good spacing ends here
+GAP_SCORED_MIN = 12  # Acceptable spacing starts here
+GAP_SCORED_MAX = 23  # Acceptable spacing ends here
+
+# Score for each spacing range, best range first (see simple_gap_score)
+SCORE_BANDS = (
+    (GAP_MIN, GAP_MAX, 100),             # Perfect spacing - the sweet spot for bacteria
+    (GAP_GOOD_MIN, GAP_GOOD_MAX, 80),    # Good spacing - still very functional
+    (GAP_SCORED_MIN, GAP_SCORED_MAX, 60), # Acceptable spacing - might work but not optimal
+)
+POOR_SCORE = 40  # Any other spacing - probably won't work as a promoter
+
+# Both promoter patterns (TTGACA and TATAAT) are 6 letters long
+MOTIF_LENGTH = 6
+MOTIF_MARK = b'X' * MOTIF_LENGTH  # What one motif looks like on the visual map
+
+# Quality description shown for each promoter score (anything else is "POOR")
+QUALITY_DESCRIPTIONS = {
+    100: "EXCELLENT (Perfect spacing!)",
+    80: "VERY GOOD (Good spacing)",
+    60: "MODERATE (Acceptable spacing)",
+}
+
+# Characters sanitizeString deletes: spaces, tabs and line breaks
+_WHITESPACE = b' \n\r\t\f\v'
+
+# Lookup tables for validateDNAString: turn a, t, c, g into A, T, C, G and
+# delete anything that isn't one of those eight letters
+_DNA_TABLE = bytes.maketrans(b'atcg', b'ATCG')
+_DELETE = bytes(b for b in range(256) if chr(b) not in 'ATCGatcg')
+
 def sanitizeString(file_path: str) -> str:
     """
     STEP 1: READ AND CLEAN THE DNA FILE
@@ -46,17 +82,18 @@ def sanitizeString(file_path: str) -> str:
     
     try:
         # Try to open and read the file
-        with open(file_path, "r") as f:        # Open the file in read mode
-            data = f.read()                    # Read everything in the file as one big string
+        with open(file_path, "rb") as f:       # Open the file in binary read mode
+            # Read everything and remove all spaces and line breaks in one pass
+            data = f.read().translate(None, _WHITESPACE)
         
         # Check if the file is empty (no content or just spaces/newlines)
-        if not data.strip():  
+        if not data:
             print("Error: The file is empty.")
             sys.exit()  # Stop - we need actual DNA content
         
-        # Clean up the DNA string by removing unwanted characters
-        cleaned = data.replace(" ", "")        # Remove all spaces
-        cleaned = cleaned.replace("\n", "")    # Remove all line breaks
+        # Non-ASCII characters can't be DNA letters, so they are simply dropped
+        cleaned = data.decode('ascii', 'ignore')
+        
         return cleaned
         
     except FileNotFoundError:
@@ -80,16 +117,9 @@ def validateDNAString(dna_seq: str) -> str:
     Output: A clean string with only A, T, C, G letters
     """
     
-    valid_bases = "ATCG"   # These are the only letters allowed in DNA
-    cleaned = ""           # Start with an empty result string
-
-    # Look at each character in the input, one by one
-    for base in dna_seq.upper():   # Convert to uppercase (so 'a' becomes 'A')
-        if base in valid_bases:    # If it's a valid DNA letter (A, T, C, or G)
-            cleaned = cleaned + base   # Add it to our clean result string
-        # If it's not a valid DNA letter, we just ignore it
-
-    return cleaned
+    # Convert to bytes, then uppercase (so 'a' becomes 'A') and drop every
+    # byte that isn't a valid DNA letter in a single pass
+    return dna_seq.encode('ascii', 'ignore').translate(_DNA_TABLE, delete=_DELETE).decode('ascii')
 
 
 def locateFirst(input_string: str) -> int:
@@ -152,6 +182,23 @@ def findAllMotifOccurrences(dna_sequence: str, motif: str) -> list:
     return positions  # Return the complete list of positions
 
 
+def _scoreFromBands(gap_distance: int) -> int:
+    """
+    What this function does:
+    - Checks the gap distance against each range in SCORE_BANDS, best first
+    - Returns the score of the first range it falls in (or POOR_SCORE)
+    """
+    for band_min, band_max, score in SCORE_BANDS:
+        if band_min <= gap_distance <= band_max:
+            return score
+    return POOR_SCORE
+
+
+# Score for every whole-number gap from 0 to GAP_SCORED_MAX, filled in once
+# from SCORE_BANDS so simple_gap_score can look common gaps up directly
+_GAP_SCORES = tuple(_scoreFromBands(gap) for gap in range(GAP_SCORED_MAX + 1))
+
+
 def simple_gap_score(gap_distance: int) -> int:
     """
     STEP 3B: SCORE HOW GOOD A PROMOTER IS
@@ -173,14 +220,56 @@ def simple_gap_score(gap_distance: int) -> int:
     Output: A score from 40 to 100
     """
     
-    if 16 <= gap_distance <= 19:
-        return 100  # Perfect spacing - this is the sweet spot for bacteria
-    elif 14 <= gap_distance <= 21:
-        return 80   # Good spacing - still very functional
-    elif 12 <= gap_distance <= 23:
-        return 60   # Acceptable spacing - might work but not optimal
-    else:
-        return 40   # Poor spacing - probably won't work as a promoter
+    # Most gaps are outside every scoring range, so answer those right away
+    if not GAP_SCORED_MIN <= gap_distance <= GAP_SCORED_MAX:
+        return POOR_SCORE
+    
+    # Whole-number gaps are looked up in a pre-filled table
+    if isinstance(gap_distance, int):
+        return _GAP_SCORES[gap_distance]
+    
+    # Anything else (like 16.5) is checked range by range
+    return _scoreFromBands(gap_distance)
+
+
+def pairMotifPositions(minus35_positions: list, minus10_positions: list) -> list:
+    """
+    What this function does:
+    - Pairs every -35 position with every -10 position that comes after it
+    - Calculates the gap distance and score for each pair
+    
+    Both position lists must be sorted from smallest to largest (which is
+    how findAllMotifOccurrences returns them).
+    
+    Input: 
+    - minus35_positions: Positions of every TTGACA in the DNA
+    - minus10_positions: Positions of every TATAAT in the DNA
+    
+    Output: List of (position_of_-35, position_of_-10, gap_distance, quality_score)
+            in the order the pairs were tried (not sorted)
+    """
+    
+    promoter_candidates = []
+    
+    for pos35 in minus35_positions:  # For each -35 element we found
+        # Gap = distance from END of -35 (TTGACA is 6 letters long) to START of -10
+        gap_start = pos35 + MOTIF_LENGTH
+        
+        # Rule: -35 must come before -10. The -10 list is sorted, so bisect
+        # finds where the -10 elements after this -35 begin and we skip the rest.
+        # (islice walks the list from there without copying it)
+        after = bisect_right(minus10_positions, pos35)
+        
+        for pos10 in islice(minus10_positions, after, None):  # Try pairing it with each later -10 element
+            gap_distance = pos10 - gap_start
+            
+            # Score this promoter candidate based on gap distance
+            score = simple_gap_score(gap_distance)
+            
+            # Add this candidate to our list
+            promoter_candidates.append((pos35, pos10, gap_distance, score))
+    
+    return promoter_candidates
 
 
 def findAllPromoterCandidates(dna_sequence: str) -> list:
@@ -214,30 +303,12 @@ def findAllPromoterCandidates(dna_sequence: str) -> list:
     # Find all the -10 elements (TATAAT patterns) in the DNA
     minus10_positions = findAllMotifOccurrences(dna_sequence, 'TATAAT')
     
-    promoter_candidates = []  # Start with empty list of candidates
-    
     # Try every possible combination of -35 and -10 elements
-    for pos35 in minus35_positions:      # For each -35 element we found
-        for pos10 in minus10_positions:  # Try pairing it with each -10 element
-            
-            # Rule: -35 must come before -10 in the DNA sequence
-            if pos35 < pos10:
-                
-                # Calculate the gap between the two elements
-                # Gap = distance from END of -35 to START of -10
-                gap_start = pos35 + 6  # End of -35 (TTGACA is 6 letters long)
-                gap_end = pos10        # Start of -10 element
-                gap_distance = gap_end - gap_start
-                
-                # Score this promoter candidate based on gap distance
-                score = simple_gap_score(gap_distance)
-                
-                # Add this candidate to our list
-                promoter_candidates.append((pos35, pos10, gap_distance, score))
+    promoter_candidates = pairMotifPositions(minus35_positions, minus10_positions)
     
     # Sort the candidates by score (best promoters first)
-    # This uses a lambda function to sort by the 4th item (index 3) which is the score
-    promoter_candidates.sort(key=lambda x: x[3], reverse=True)
+    # itemgetter(3) picks the 4th item (index 3) which is the score
+    promoter_candidates.sort(key=itemgetter(3), reverse=True)
     
     return promoter_candidates, minus35_positions, minus10_positions
 
@@ -264,33 +335,30 @@ def output(first_index: int, last_index: int, promoter_candidates: list):
     """
     
     # Create a line of underscores the same length as our DNA sequence
-    cs_indicator_string: str = '_' * len(validated_string)
-    cs_indicator_string = list(cs_indicator_string)  # Convert to list so we can modify it
+    # (a bytearray lets us change single letters in place without copying the whole line)
+    sequence_length = len(validated_string)  # Measure once instead of on every check below
+    cs_indicator_string = bytearray(b'_') * sequence_length
     
-    # Mark all the promoter candidates we found with 'X' symbols
-    for pos35, pos10, gap_distance, score in promoter_candidates:
-        
-        # Mark the -35 element (TTGACA) with 'X' marks
-        for i in range(0, 6):  # TTGACA is 6 letters long
-            if pos35 + i < len(cs_indicator_string):  # Make sure we don't go past the end
-                cs_indicator_string[pos35 + i] = 'X'
-        
-        # Mark the -10 element (TATAAT) with 'X' marks  
-        for i in range(0, 6):  # TATAAT is 6 letters long
-            if pos10 + i < len(cs_indicator_string):  # Make sure we don't go past the end
-                cs_indicator_string[pos10 + i] = 'X'
+    # Mark all the promoter candidates we found with 'X' symbols.
+    # Each motif can be part of many candidates, so collect the distinct
+    # -35 (TTGACA) and -10 (TATAAT) positions first and mark each one only once.
+    marked_positions = {candidate[0] for candidate in promoter_candidates}
+    marked_positions.update(candidate[1] for candidate in promoter_candidates)
 
     # Also mark the legacy first occurrences (for backward compatibility)
     if first_index >= 0:  # If we found a -35 element
-        for i in range(0, 6):  # Mark all 6 positions of TTGACA
-            cs_indicator_string[first_index + i] = 'X'
-    
+        marked_positions.add(first_index)
     if last_index >= 0:   # If we found a -10 element
-        for i in range(0, 6):  # Mark all 6 positions of TATAAT
-            cs_indicator_string[last_index + i] = 'X'
+        marked_positions.add(last_index)
 
-    # Convert our list back to a string for display
-    cs_indicator_string = ''.join(cs_indicator_string)
+    # Overwrite all 6 letters of each motif at once (the marks are cut short
+    # if a motif would run past the end of the DNA sequence, and a motif that
+    # starts past the end adds no marks at all)
+    for pos in marked_positions:
+        cs_indicator_string[pos:pos + MOTIF_LENGTH] = MOTIF_MARK[:max(0, sequence_length - pos)]
+
+    # Convert our bytes back to a string for display
+    cs_indicator_string = cs_indicator_string.decode('ascii')
 
     # Print the results with nice formatting
     print(f"DNA Sequence: \t\t{validated_string}")
@@ -339,23 +407,18 @@ if __name__ == "__main__":
     if promoter_candidates:
         print(f"\n🎉 SUCCESS! Found {len(promoter_candidates)} promoter candidate(s):\n")
         
-        for i, (pos35, pos10, gap_distance, score) in enumerate(promoter_candidates, 1):
-            # Determine quality description based on score
-            if score == 100:
-                quality = "EXCELLENT (Perfect spacing!)"
-            elif score == 80:
-                quality = "VERY GOOD (Good spacing)"
-            elif score == 60:
-                quality = "MODERATE (Acceptable spacing)"
-            else:
-                quality = "POOR (Suboptimal spacing)"
-            
-            print(f"Promoter #{i}: {quality}")
-            print(f"  📍 -35 motif (TTGACA) starts at position: {pos35}")
-            print(f"  📍 -10 motif (TATAAT) starts at position: {pos10}")
-            print(f"  📏 Gap distance: {gap_distance} base pairs")
-            print(f"  ⭐ Quality score: {score}/100")
-            print()
+        # Format each candidate's report as one block of text and write the
+        # blocks out one at a time as they are made (so the whole report is
+        # never held in memory at once)
+        sys.stdout.writelines(
+            f"Promoter #{i}: {QUALITY_DESCRIPTIONS.get(score, 'POOR (Suboptimal spacing)')}\n"
+            f"  📍 -35 motif (TTGACA) starts at position: {pos35}\n"
+            f"  📍 -10 motif (TATAAT) starts at position: {pos10}\n"
+            f"  📏 Gap distance: {gap_distance} base pairs\n"
+            f"  ⭐ Quality score: {score}/100\n"
+            "\n"
+            for i, (pos35, pos10, gap_distance, score) in enumerate(promoter_candidates, 1)
+        )
     elif minus35_positions and minus10_positions:
         print("\n❌ No promoter candidates found in this sequence.")
         print("This DNA might not contain bacterial promoters, or they might be")
@@ -371,8 +434,10 @@ if __name__ == "__main__":
         print("This DNA might not contain bacterial promoters.")
 
     # Step 7: Legacy analysis (for backward compatibility with older code)
-    first_index = locateFirst(validated_string)
-    last_index = locateLast(validated_string)
+    # The first TTGACA and TATAAT were already found above, so reuse those
+    # positions instead of searching the DNA again with locateFirst/locateLast
+    first_index = minus35_positions[0] if minus35_positions else -1
+    last_index = minus10_positions[0] if minus10_positions else -1
     
     # Step 8: Show visual representation of where promoters are located
     print("\n" + "="*60)